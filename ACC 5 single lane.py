@@ -1,5 +1,25 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import pygame
-import random
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels below then run as plain Python.
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; without it everything stays on the CPU.
+    cp = None
 
 pygame.init()
 
@@ -34,20 +54,69 @@ RED = (255, 0, 0)
 SAFE_DISTANCE = 100         # If front car is within this bounding distance, slow down.
 DETECTION_DISTANCE = 150    # If front car is within this bounding distance, cone goes red.
 
+# Front distance reported when there is no car ahead. Any real gap is shorter
+# (cars wrap 100 px past either edge), and unlike inf it is safe to compare
+# inside the fastmath kernels, which assume finite values.
+_INF = SCREEN_WIDTH * 2.0
+
+# Above this many vehicles the simulation state moves to the GPU (when CuPy is
+# installed); for a handful of cars the transfer overhead outweighs the gain.
+GPU_VEHICLE_THRESHOLD = 1000
+
+# Above this many vehicles (and with Numba available) the road is split into
+# PARTITIONS slabs that are stepped on separate threads.
+PARALLEL_VEHICLE_THRESHOLD = 5000
+PARTITIONS = os.cpu_count() or 1
+
+# --------------------------------------------------
+# Fonts
+# --------------------------------------------------
+# Built once at import; SysFont lookups are far too slow to repeat per frame.
+_FONT_20 = pygame.font.SysFont(None, 20)
+_FONT_24 = pygame.font.SysFont(None, 24)
+_FONT_28 = pygame.font.SysFont(None, 28)
+_FONTS = {20: _FONT_20, 24: _FONT_24, 28: _FONT_28}
+
+# Rendered labels that never change (vehicle names, sign text),
+# keyed by (text, size, color).
+_STATIC_TEXT_CACHE = {}
+
 # --------------------------------------------------
 # Helper Functions
 # --------------------------------------------------
-def draw_road():
-    SCREEN.fill(GRASS_COLOR)  # Grass background
+def render_static_text(text, size, color):
+    """
+    Return a rendered Surface for a label that does not change between frames.
+    """
+    key = (text, size, color)
+    surf = _STATIC_TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _FONTS[size].render(text, True, color).convert_alpha()
+        _STATIC_TEXT_CACHE[key] = surf
+    return surf
+
+def render_speed_hud(speeds):
+    """
+    Render the per-car speed lines onto one Surface, so the HUD is a single
+    blit and only needs redrawing when a speed changes.
+    """
+    hud = pygame.Surface((220, 30 * len(speeds)), pygame.SRCALPHA)
+    for i, speed in enumerate(speeds):
+        txt = _FONT_28.render(f"Car {i+1} Speed: {speed:.1f}", True, (0, 0, 0))
+        hud.blit(txt, (0, 30 * i))
+    return hud.convert_alpha()
+
+def draw_road(surface):
+    surface.fill(GRASS_COLOR)  # Grass background
     pygame.draw.rect(
-        SCREEN,
+        surface,
         ROAD_COLOR,
         (ROAD_LEFT, ROAD_CENTER_Y - LANE_WIDTH // 2, ROAD_RIGHT, LANE_WIDTH)
     )
-    pygame.draw.line(SCREEN, WHITE, (ROAD_LEFT, ROAD_CENTER_Y - LANE_WIDTH // 2), (ROAD_RIGHT, ROAD_CENTER_Y - LANE_WIDTH // 2), 4)
-    pygame.draw.line(SCREEN, WHITE, (ROAD_LEFT, ROAD_CENTER_Y + LANE_WIDTH // 2), (ROAD_RIGHT, ROAD_CENTER_Y + LANE_WIDTH // 2), 4)
+    pygame.draw.line(surface, WHITE, (ROAD_LEFT, ROAD_CENTER_Y - LANE_WIDTH // 2), (ROAD_RIGHT, ROAD_CENTER_Y - LANE_WIDTH // 2), 4)
+    pygame.draw.line(surface, WHITE, (ROAD_LEFT, ROAD_CENTER_Y + LANE_WIDTH // 2), (ROAD_RIGHT, ROAD_CENTER_Y + LANE_WIDTH // 2), 4)
 
-def draw_trees():
+def draw_trees(surface):
     # Draw trees on the sides of the road
     tree_positions = [(100, 100), (200, 100), (100, 500),
                       (SCREEN_WIDTH - 100, 100), (SCREEN_WIDTH - 200, 100), (SCREEN_WIDTH - 100, 500)]
@@ -57,14 +126,147 @@ def draw_trees():
         leaves_color = (0, 100, 0)
         trunk_w, trunk_h = 10, 30
         # Draw trunk
-        pygame.draw.rect(SCREEN, trunk_color, (tx, ty, trunk_w, trunk_h))
+        pygame.draw.rect(surface, trunk_color, (tx, ty, trunk_w, trunk_h))
         # Draw leaves
-        pygame.draw.circle(SCREEN, leaves_color, (tx + trunk_w // 2, ty), 20)
+        pygame.draw.circle(surface, leaves_color, (tx + trunk_w // 2, ty), 20)
+
+def _build_background(surface):
+    """
+    Rasterize the static scenery once; the main loop only blits the result.
+    """
+    draw_road(surface)
+    draw_trees(surface)
+
+# Opaque and in the display pixel format, so the per-frame blit is a plain copy.
+BACKGROUND = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+_build_background(BACKGROUND)
+
+def _bake_cone(color, points, size):
+    """
+    Draw one translucent cone into a small sprite so draw_cone only has to blit it.
+    """
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(surf, (*color, 60), points)
+    return surf.convert_alpha()
+
+# Cone sprites: apex at the middle of the left edge, fanning 250 px forward
+# and 80 px to either side.
+_CONE_POINTS = [(0, 80), (250, 0), (250, 160)]
+CONE_GREEN = _bake_cone(GREEN, _CONE_POINTS, (251, 161))
+CONE_RED = _bake_cone(RED, _CONE_POINTS, (251, 161))
+
+# --------------------------------------------------
+# Front-Car Search
+# --------------------------------------------------
+def find_front_cars(xs, widths):
+    """
+    Find every vehicle's front car from SoA position arrays, without branches.
+
+    Sort the vehicles by x once, then binary-search that order for the first
+    car whose rear bumper is at or past each car's front bumper. Cars with no
+    such car ahead are masked out with np.where rather than an if per car.
+
+    Returns (front_idx, front_dist): the index of the closest car ahead whose
+    rear bumper is at or past this car's front bumper, and the bounding
+    distance to it. front_idx is -1 (and front_dist _INF) when there is none.
+
+    Works unchanged on CuPy arrays, in which case the results stay on the GPU.
+    """
+    xp = cp.get_array_module(xs) if cp is not None else np
+    n = len(xs)
+    order = xp.argsort(xs, kind="stable")
+    sorted_xs = xs[order]
+    front_edges = xs + widths
+    pos = xp.searchsorted(sorted_xs, front_edges, side="left")
+    has_front = pos < n
+    pos = xp.minimum(pos, n - 1)
+    front_idx = xp.where(has_front, order[pos], -1)
+    front_dist = xp.where(has_front, sorted_xs[pos] - front_edges, _INF)
+    return front_idx, front_dist
+
+# --------------------------------------------------
+# Update Kernel
+# --------------------------------------------------
+@njit(cache=True, fastmath=True)
+def _step(xs, speeds, base_speeds, widths, front_idx, front_dist, safe_distance, screen_width):
+    """
+    Advance every vehicle by one tick, in place, given its front car.
+    Every car reads its front car's position from the start of the tick,
+    so the result does not depend on update order. This is _step_partition
+    with the whole road as one slab, so every step path shares one rule.
+    """
+    n = xs.shape[0]
+    front_xs = np.zeros(n)
+    for i in range(n):
+        if front_idx[i] >= 0:
+            front_xs[i] = xs[front_idx[i]]
+
+    _step_partition(xs, speeds, base_speeds, widths, front_dist, front_xs, np.arange(n),
+                    safe_distance, screen_width)
+
+def _step_array(xs, speeds, base_speeds, widths, front_idx, front_dist, safe_distance, screen_width):
+    """
+    Whole-array form of _step for CuPy, where a per-car loop would crawl.
+    Every car reads its front car's position from the start of the tick.
+    """
+    xp = cp.get_array_module(xs)
+    close = (front_idx >= 0) & (front_dist < safe_distance)
+    xs[:] = xp.where(close, xs[front_idx] - widths - safe_distance, xs)
+    speeds[:] = xp.where(close, speeds, base_speeds)
+    xs += speeds
+    xs[xs > screen_width + 100] = -100.0
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _step_partition(xs, speeds, base_speeds, widths, front_dist, front_xs, members,
+                    safe_distance, screen_width):
+    """
+    Advance the vehicles listed in 'members' (one slab of road), in place.
+
+    front_xs holds each car's front-car position from the start of the tick,
+    so slabs never read each other's half-updated state and can run at once.
+    Cars with no front car have front_dist _INF.
+    """
+    for k in range(members.shape[0]):
+        i = members[k]
+        if front_dist[i] < safe_distance:
+            # Prevent overlap by stopping at the safe distance
+            xs[i] = front_xs[i] - widths[i] - safe_distance
+        else:
+            speeds[i] = base_speeds[i]
+
+        # Move to the right (increasing x)
+        xs[i] += speeds[i]
+        if xs[i] > screen_width + 100:
+            xs[i] = -100.0
+
+def _step_parallel(pool, xs, speeds, base_speeds, widths, front_idx, front_dist,
+                   safe_distance, screen_width):
+    """
+    Same signature as _step (after 'pool'): split the road into slabs of
+    equal car count and step each slab on its own worker thread.
+    """
+    front_xs = xs[front_idx]
+    slabs = np.array_split(np.argsort(xs, kind="stable"), PARTITIONS)
+    list(pool.map(lambda members: _step_partition(
+        xs, speeds, base_speeds, widths, front_dist, front_xs, members,
+        safe_distance, screen_width), slabs))
+
+# Compile _step now (or load it from cache) so the first frame doesn't stall
+_step(np.zeros(1), np.zeros(1), np.zeros(1), np.ones(1), np.full(1, -1), np.full(1, _INF),
+      SAFE_DISTANCE, SCREEN_WIDTH)
 
 # --------------------------------------------------
 # Vehicle Class
 # --------------------------------------------------
 class Vehicle:
+    # Fixed attribute slots: no per-instance __dict__, and faster attribute access.
+    __slots__ = ('x', 'y', 'color', 'base_speed', 'speed', 'width', 'height', 'name', '_last_front')
+
+    # Where the cone sprite and distance label go, relative to the front bumper
+    # (x + width, y); fixed for every car, so draw_cone only adds them.
+    CONE_OFFSET = (0, -80)
+    LABEL_OFFSET = (5, 5)
+
     def __init__(self, x, color, base_speed, name):
         self.x = x
         self.y = ROAD_CENTER_Y
@@ -74,77 +276,43 @@ class Vehicle:
         self.width = 60
         self.height = 30
         self.name = name  # Add name attribute
-
-    def update(self, vehicles):
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
-
-        if front_car is not None:
-            if bounding_dist < SAFE_DISTANCE:
-                # Prevent overlap by stopping at the safe distance
-                self.x = front_car.x - self.width - SAFE_DISTANCE
-            else:
-                self.speed = self.base_speed
-        else:
-            self.speed = self.base_speed
-
-        # Move to the right (increasing x)
-        self.x += self.speed
-        if self.x > SCREEN_WIDTH + 100:
-            self.x = -100
-
-    def get_front_car_bounding_distance(self, vehicles):
-        front_car = None
-        min_dist = float('inf')
-        behind_front_edge = self.x + self.width
-
-        for v in vehicles:
-            if v is self:
-                continue
-            if v.x > self.x:
-                dist = v.x - behind_front_edge
-                if 0 <= dist < min_dist:
-                    min_dist = dist
-                    front_car = v
-
-        if front_car is not None:
-            return (front_car, min_dist)
-        return (None, float('inf'))
+        self._last_front = (None, _INF)  # Set each tick by main, read by draw_cone
 
     def draw(self):
-        # Draw a more car-like shape
-        rect_x = self.x
-        rect_y = self.y - self.height / 2
-        pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, self.width, self.height))
+        # Draw a more car-like shape; returns the screen rects it touched
+        # Quantize once: the physics keeps float positions, pygame gets ints
+        ix, iy = int(self.x), int(self.y)
+        rect_x = ix
+        rect_y = iy - self.height // 2
+        body_rect = pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, self.width, self.height))
         pygame.draw.rect(SCREEN, (0, 0, 0), (rect_x + 5, rect_y + 5, self.width - 10, self.height - 10))  # Inner rectangle for detail
 
         # Draw the name of the vehicle
-        font = pygame.font.SysFont(None, 24)
-        name_text = font.render(self.name, True, (0, 0, 0))
-        SCREEN.blit(name_text, (self.x + 5, self.y - self.height / 2 + 5))
+        name_text = render_static_text(self.name, 24, (0, 0, 0))
+        name_rect = SCREEN.blit(name_text, (rect_x + 5, rect_y + 5))
+        return [body_rect, name_rect]
 
     def draw_cone(self, vehicles):
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
+        # Returns the screen rects it touched.
+        # Reuse the reading taken during the update; 'vehicles' is kept for compatibility.
+        front_car, bounding_dist = self._last_front
 
-        cone_color_rgba = (*GREEN, 60)
+        cone_sprite = CONE_GREEN
         dist_text_value = None
 
         if front_car is not None and bounding_dist < DETECTION_DISTANCE:
-            cone_color_rgba = (*RED, 60)
+            cone_sprite = CONE_RED
             dist_text_value = bounding_dist
 
-        cone_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        cone_start = (self.x + self.width, self.y)
-        left_spread = (self.x + self.width + 250, self.y - 80)
-        right_spread = (self.x + self.width + 250, self.y + 80)
-
-        pygame.draw.polygon(cone_surface, cone_color_rgba, [cone_start, left_spread, right_spread])
-        SCREEN.blit(cone_surface, (0, 0))
+        front_x, iy = int(self.x) + self.width, int(self.y)
+        dx, dy = self.CONE_OFFSET
+        dirty = [SCREEN.blit(cone_sprite, (front_x + dx, iy + dy))]
 
         if dist_text_value is not None:
-            font = pygame.font.SysFont(None, 20)
-            dist_text = font.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
-            text_pos = (cone_start[0] + 5, cone_start[1] + 5)
-            SCREEN.blit(dist_text, text_pos)
+            dist_text = _FONT_20.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
+            dx, dy = self.LABEL_OFFSET
+            dirty.append(SCREEN.blit(dist_text, (front_x + dx, iy + dy)))
+        return dirty
 
 # --------------------------------------------------
 # Main Loop
@@ -159,36 +327,96 @@ def main():
 
     vehicles = [red_car, blue_car, green_car]
 
+    # SoA state: these arrays drive the simulation and the Vehicle objects
+    # are refreshed from them each tick for drawing.
+    xs = np.array([v.x for v in vehicles], dtype=float)
+    speeds = np.array([v.speed for v in vehicles], dtype=float)
+    base_speeds = np.array([v.base_speed for v in vehicles], dtype=float)
+    widths = np.array([v.width for v in vehicles], dtype=float)
+
+    # Large fleets run on the GPU; drawing stays on the CPU, so the results
+    # are copied back once per frame.
+    use_gpu = cp is not None and len(vehicles) > GPU_VEHICLE_THRESHOLD
+    if use_gpu:
+        xs, speeds, base_speeds, widths = (cp.asarray(a) for a in (xs, speeds, base_speeds, widths))
+    step = _step_array if use_gpu else _step
+
+    # Large fleets without a GPU are split across CPU threads instead
+    pool = None
+    if not use_gpu and HAVE_NUMBA and len(vehicles) > PARALLEL_VEHICLE_THRESHOLD:
+        pool = ThreadPoolExecutor(PARTITIONS)
+        step = partial(_step_parallel, pool)
+
+    # The screen starts as the full background; after that only the regions
+    # that change are repainted and pushed to the display.
+    SCREEN.blit(BACKGROUND, (0, 0))
+    pygame.display.flip()
+    prev_dirty = []
+    hud_speeds = None
+    hud = None
+
+    # Only QUIT and VIDEOEXPOSE are handled, so keep everything else out of
+    # the queue. VIDEOEXPOSE matters because only dirty rects are presented:
+    # once the window is uncovered or restored, the whole frame must be redrawn.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.VIDEOEXPOSE])
+
     running = True
     while running:
         clock.tick(FPS)
-        for event in pygame.event.get():
+        # A filtered get() pumps SDL and returns only the events handled here
+        exposed = False
+        for event in pygame.event.get([pygame.QUIT, pygame.VIDEOEXPOSE]):
             if event.type == pygame.QUIT:
                 running = False
-
-        # Update each vehicle
-        for v in vehicles:
-            v.update(vehicles)
-
-        # Draw scene elements
-        draw_road()
-        draw_trees()
+            else:
+                exposed = True
+
+        # Prepare phase: find every car's front car at once
+        front_idx, front_dist = find_front_cars(xs, widths)
+
+        # Update phase: advance all vehicles in one compiled pass
+        step(xs, speeds, base_speeds, widths, front_idx, front_dist, SAFE_DISTANCE, SCREEN_WIDTH)
+
+        # Copy the new state back onto the vehicles for drawing
+        # (tolist() also brings CuPy arrays back to the host)
+        for v, x, speed, j, dist in zip(vehicles, xs.tolist(), speeds.tolist(),
+                                        front_idx.tolist(), front_dist.tolist()):
+            v.x = x
+            v.speed = speed
+            v._last_front = (vehicles[j] if j >= 0 else None, dist)
+
+        # Draw scene elements: erase last frame's cars, cones and HUD by
+        # restoring the background underneath them (all of it after an expose)
+        if exposed:
+            SCREEN.blit(BACKGROUND, (0, 0))
+        else:
+            for rect in prev_dirty:
+                SCREEN.blit(BACKGROUND, rect, rect)
+        dirty = []
 
         # Draw vehicles and their cones
         for v in vehicles:
-            v.draw()
-            v.draw_cone(vehicles)
+            dirty.extend(v.draw())
+            dirty.extend(v.draw_cone(vehicles))
 
         # Display the speeds of each car on the screen
-        font = pygame.font.SysFont(None, 28)
-        y_offset = 10
-        for i, v in enumerate(vehicles):
-            txt = font.render(f"Car {i+1} Speed: {v.speed:.1f}", True, (0, 0, 0))
-            SCREEN.blit(txt, (10, y_offset))
-            y_offset += 30
-
-        pygame.display.flip()
+        shown_speeds = [v.speed for v in vehicles]
+        if shown_speeds != hud_speeds:
+            hud = render_speed_hud(shown_speeds)
+            hud_speeds = shown_speeds
+        dirty.append(SCREEN.blit(hud, (10, 10)))
+
+        # Present the erased regions along with the newly drawn ones, or the
+        # whole frame if the window contents were lost
+        if exposed:
+            pygame.display.flip()
+        else:
+            pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
 
+    if pool is not None:
+        pool.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -1,7 +1,25 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import pygame
-import math
-import random
-from collections import deque
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels below then run as plain Python.
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; without it everything stays on the CPU.
+    cp = None
 
 pygame.init()
 
@@ -37,29 +55,78 @@ RED = (255, 0, 0)
 SAFE_DISTANCE = 100         # If front car is within this bounding distance, slow down.
 DETECTION_DISTANCE = 150    # If front car is within this bounding distance, cone goes red.
 
+# Front distance reported when there is no car ahead. Any real gap is shorter
+# (cars wrap 100 px past either edge), and unlike inf it is safe to compare
+# inside the fastmath kernels, which assume finite values.
+_INF = SCREEN_HEIGHT * 2.0
+
+# Above this many vehicles the simulation state moves to the GPU (when CuPy is
+# installed); for a handful of cars the transfer overhead outweighs the gain.
+GPU_VEHICLE_THRESHOLD = 1000
+
+# Above this many vehicles (and with Numba available) the road is split into
+# PARTITIONS slabs that are stepped on separate threads.
+PARALLEL_VEHICLE_THRESHOLD = 5000
+PARTITIONS = os.cpu_count() or 1
+
+# --------------------------------------------------
+# Fonts
+# --------------------------------------------------
+# Built once at import; SysFont lookups are far too slow to repeat per frame.
+_FONT_20 = pygame.font.SysFont(None, 20)
+_FONT_24 = pygame.font.SysFont(None, 24)
+_FONT_28 = pygame.font.SysFont(None, 28)
+_FONTS = {20: _FONT_20, 24: _FONT_24, 28: _FONT_28}
+
+# Rendered labels that never change (vehicle names, sign text),
+# keyed by (text, size, color).
+_STATIC_TEXT_CACHE = {}
+
 # --------------------------------------------------
 # Helper Functions
 # --------------------------------------------------
-def draw_road():
+def render_static_text(text, size, color):
+    """
+    Return a rendered Surface for a label that does not change between frames.
+    """
+    key = (text, size, color)
+    surf = _STATIC_TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _FONTS[size].render(text, True, color).convert_alpha()
+        _STATIC_TEXT_CACHE[key] = surf
+    return surf
+
+def render_speed_hud(speeds):
+    """
+    Render the per-car speed lines onto one Surface, so the HUD is a single
+    blit and only needs redrawing when a speed changes.
+    """
+    hud = pygame.Surface((220, 30 * len(speeds)), pygame.SRCALPHA)
+    for i, speed in enumerate(speeds):
+        txt = _FONT_28.render(f"Car {i+1} Speed: {speed:.1f}", True, (0, 0, 0))
+        hud.blit(txt, (0, 30 * i))
+    return hud.convert_alpha()
+
+def draw_road(surface):
     """
     Draw the road with:
     - Gray rectangle for asphalt.
     - White boundary lines (no yellow center lines).
     """
-    SCREEN.fill(GRASS_COLOR)  # Grass background
+    surface.fill(GRASS_COLOR)  # Grass background
     
     # Road rectangle
     road_left = ROAD_CENTER_X - (LANE_WIDTH // 2)
     pygame.draw.rect(
-        SCREEN,
+        surface,
         ROAD_COLOR,
         (road_left, ROAD_TOP, LANE_WIDTH, ROAD_BOTTOM - ROAD_TOP)
     )
     
     # White boundary lines
-    pygame.draw.line(SCREEN, WHITE, (road_left, ROAD_TOP), (road_left, ROAD_BOTTOM), 4)
+    pygame.draw.line(surface, WHITE, (road_left, ROAD_TOP), (road_left, ROAD_BOTTOM), 4)
     pygame.draw.line(
-        SCREEN,
+        surface,
         WHITE,
         (road_left + LANE_WIDTH, ROAD_TOP),
         (road_left + LANE_WIDTH, ROAD_BOTTOM),
@@ -67,7 +134,7 @@ def draw_road():
     )
 
 
-def draw_trees_and_signs():
+def draw_trees_and_signs(surface):
     """
     Draw a few static trees and signs for decoration.
     """
@@ -79,28 +146,188 @@ def draw_trees_and_signs():
         leaves_color = (0, 100, 0)
         trunk_w, trunk_h = 10, 30
         # Trunk
-        pygame.draw.rect(SCREEN, trunk_color, (tx, ty, trunk_w, trunk_h))
+        pygame.draw.rect(surface, trunk_color, (tx, ty, trunk_w, trunk_h))
         # Leaves
-        pygame.draw.circle(SCREEN, leaves_color, (tx + trunk_w // 2, ty), 20)
+        pygame.draw.circle(surface, leaves_color, (tx + trunk_w // 2, ty), 20)
 
     # Simple sign example
     sign_positions = [(100, 400), (SCREEN_WIDTH - 150, 300)]
-    font = pygame.font.SysFont(None, 24)
     for (sx, sy) in sign_positions:
         post_color = (120, 120, 120)
-        pygame.draw.rect(SCREEN, post_color, (sx, sy, 5, 40))
+        pygame.draw.rect(surface, post_color, (sx, sy, 5, 40))
         # Sign board
         board_color = (255, 255, 224)
         board_w, board_h = 60, 40
         pygame.draw.rect(
-            SCREEN,
+            surface,
             board_color,
             (sx - board_w // 2 + 3, sy - board_h, board_w, board_h)
         )
 
         # Text on sign
-        text_surf = font.render("Limit 80", True, (0, 0, 0))
-        SCREEN.blit(text_surf, (sx - board_w // 2 + 5, sy - board_h + 5))
+        text_surf = render_static_text("Limit 80", 24, (0, 0, 0))
+        surface.blit(text_surf, (sx - board_w // 2 + 5, sy - board_h + 5))
+
+
+def _build_background(surface):
+    """
+    Rasterize the static scenery once; the main loop only blits the result.
+    """
+    draw_road(surface)
+    draw_trees_and_signs(surface)
+
+# Opaque and in the display pixel format, so the per-frame blit is a plain copy.
+BACKGROUND = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+_build_background(BACKGROUND)
+
+
+def _bake_cone(color, points, size):
+    """
+    Draw one translucent cone into a small sprite so draw_cone only has to blit it.
+    """
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(surf, (*color, 60), points)
+    return surf.convert_alpha()
+
+# Cone sprites, one per color and lane direction. Each fans 250 px forward
+# and 80 px to either side of its apex.
+_CONE_SIZE = (161, 251)
+_CONE_POINTS_DOWN = [(80, 0), (0, 250), (160, 250)]  # apex at top-center
+_CONE_POINTS_UP = [(80, 250), (0, 0), (160, 0)]      # apex at bottom-center
+CONE_GREEN_DOWN = _bake_cone(GREEN, _CONE_POINTS_DOWN, _CONE_SIZE)
+CONE_RED_DOWN = _bake_cone(RED, _CONE_POINTS_DOWN, _CONE_SIZE)
+CONE_GREEN_UP = _bake_cone(GREEN, _CONE_POINTS_UP, _CONE_SIZE)
+CONE_RED_UP = _bake_cone(RED, _CONE_POINTS_UP, _CONE_SIZE)
+
+
+# --------------------------------------------------
+# Front-Car Search
+# --------------------------------------------------
+def find_front_cars(rears, fronts, lanes):
+    """
+    Find every vehicle's front car from SoA arrays.
+
+    'rears' and 'fronts' hold each car's rear and front edge measured along
+    its own direction of travel, so a larger value is always further ahead:
+      - Downward lane (lane_index=1): rear = y, front = y + height.
+      - Upward lane (lane_index=0): rear = -(y + height), front = -y.
+
+    Within each lane, sort the vehicles by rear edge once, then binary-search
+    that order for the first car whose rear edge is at or past each car's
+    front edge. Cars with no such car ahead are masked out with np.where
+    rather than an if per car.
+
+    Returns (front_idx, front_dist): the index of the closest car ahead in the
+    same lane whose rear edge is at or past this car's front edge, and the
+    bounding distance to it. front_idx is -1 (and front_dist _INF) when there
+    is none.
+
+    Works unchanged on CuPy arrays, in which case the results stay on the GPU.
+    """
+    xp = cp.get_array_module(rears) if cp is not None else np
+    front_idx = xp.full(len(rears), -1)
+    front_dist = xp.full(len(rears), _INF)
+    for lane in xp.unique(lanes).tolist():
+        members = xp.flatnonzero(lanes == lane)
+        order = members[xp.argsort(rears[members], kind="stable")]
+        sorted_rears = rears[order]
+        lane_fronts = fronts[members]
+        pos = xp.searchsorted(sorted_rears, lane_fronts, side="left")
+        has_front = pos < len(order)
+        pos = xp.minimum(pos, len(order) - 1)
+        front_idx[members] = xp.where(has_front, order[pos], -1)
+        front_dist[members] = xp.where(has_front, sorted_rears[pos] - lane_fronts, _INF)
+    return front_idx, front_dist
+
+
+# --------------------------------------------------
+# Update Kernel
+# --------------------------------------------------
+@njit(cache=True, fastmath=True)
+def _step(ys, speeds, base_speeds, lanes, front_idx, front_dist, safe_distance, screen_height):
+    """
+    Advance every vehicle by one tick, in place, given its front car.
+    Every car reads its front car's speed from the start of the tick,
+    so the result does not depend on update order. This is _step_partition
+    with the whole road as one slab, so every step path shares one rule.
+    """
+    n = ys.shape[0]
+    front_speeds = np.zeros(n)
+    for i in range(n):
+        if front_idx[i] >= 0:
+            front_speeds[i] = speeds[front_idx[i]]
+
+    _step_partition(ys, speeds, base_speeds, lanes, front_dist, front_speeds, np.arange(n),
+                    safe_distance, screen_height)
+
+def _step_array(ys, speeds, base_speeds, lanes, front_idx, front_dist, safe_distance, screen_height):
+    """
+    Whole-array form of _step for CuPy, where a per-car loop would crawl.
+    Every car reads its front car's speed from the start of the tick.
+    """
+    xp = cp.get_array_module(ys)
+    up = lanes == 0
+    close = (front_idx >= 0) & (front_dist < safe_distance)
+    speeds[:] = xp.where(close, xp.minimum(speeds, speeds[front_idx]), base_speeds)
+
+    # Push close cars back out of the overlap, then move along the lane
+    overlap = xp.where(close, safe_distance - front_dist, 0.0)
+    # (in the same order as _step, so both round identically)
+    ys += xp.where(up, overlap, -overlap)
+    ys += xp.where(up, -speeds, speeds)
+    ys[up & (ys < -100)] = screen_height + 100.0
+    ys[~up & (ys > screen_height + 100)] = -100.0
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _step_partition(ys, speeds, base_speeds, lanes, front_dist, front_speeds, members,
+                    safe_distance, screen_height):
+    """
+    Advance the vehicles listed in 'members' (one slab of road), in place.
+
+    front_speeds holds each car's front-car speed from the start of the tick,
+    so slabs never read each other's half-updated state and can run at once.
+    Cars with no front car have front_dist _INF.
+    """
+    for k in range(members.shape[0]):
+        i = members[k]
+        if front_dist[i] < safe_distance:
+            # Decelerate or match front car's speed
+            speeds[i] = min(speeds[i], front_speeds[i])
+
+            # Forcibly move this car back so it never overlaps the front car
+            overlap_amount = safe_distance - front_dist[i]
+            if lanes[i] == 0:
+                ys[i] += overlap_amount
+            else:
+                ys[i] -= overlap_amount
+        else:
+            speeds[i] = base_speeds[i]
+
+        # Update position based on lane direction
+        if lanes[i] == 0:
+            ys[i] -= speeds[i]
+            if ys[i] < -100:
+                ys[i] = screen_height + 100.0
+        else:
+            ys[i] += speeds[i]
+            if ys[i] > screen_height + 100:
+                ys[i] = -100.0
+
+def _step_parallel(pool, ys, speeds, base_speeds, lanes, front_idx, front_dist,
+                   safe_distance, screen_height):
+    """
+    Same signature as _step (after 'pool'): split the road into slabs of
+    equal car count and step each slab on its own worker thread.
+    """
+    front_speeds = speeds[front_idx]
+    slabs = np.array_split(np.argsort(ys, kind="stable"), PARTITIONS)
+    list(pool.map(lambda members: _step_partition(
+        ys, speeds, base_speeds, lanes, front_dist, front_speeds, members,
+        safe_distance, screen_height), slabs))
+
+# Compile _step now (or load it from cache) so the first frame doesn't stall
+_step(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64), np.full(1, -1),
+      np.full(1, _INF), SAFE_DISTANCE, SCREEN_HEIGHT)
 
 
 # --------------------------------------------------
@@ -112,6 +339,17 @@ class Vehicle:
     Each vehicle can have an initial speed (which won't increase),
     and it moves either up or down depending on the lane.
     """
+    # Fixed attribute slots: no per-instance __dict__, and faster attribute access.
+    __slots__ = ('x', 'y', 'color', 'base_speed', 'speed', 'width', 'height', 'lane_index', '_last_front')
+
+    # Cone sprite and distance label placement relative to (x, y), indexed by
+    # lane_index: lane 0 fans up from the top edge, lane 1 fans down from the
+    # bottom edge (height is 60 for every car).
+    CONE_OFFSETS = ((-80, -250), (-80, 60))
+    LABEL_OFFSETS = ((5, -20), (5, 65))
+    CONE_SPRITES_GREEN = (CONE_GREEN_UP, CONE_GREEN_DOWN)
+    CONE_SPRITES_RED = (CONE_RED_UP, CONE_RED_DOWN)
+
     def __init__(self, x, y, color, base_speed, lane_index):
         self.x = x
         self.y = y
@@ -128,6 +366,9 @@ class Vehicle:
         # Position the car horizontally according to lane index
         self.set_lane_position(lane_index)
 
+        # (front_car, bounding_dist) from the last tick, set by main() for draw_cone().
+        self._last_front = (None, _INF)
+
     def set_lane_position(self, lane_idx):
         """
         Centers the car in the specified lane horizontally.
@@ -137,140 +378,43 @@ class Vehicle:
         lane_center_x = road_left + single_lane_width * (lane_idx + 0.5)
         self.x = lane_center_x
 
-    def update(self, vehicles):
-        """
-        Move this vehicle either up or down, but first check if there's
-        a car in front that's too close in the same lane to avoid overlap.
-        """
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
-
-        if front_car is not None:
-            # If bounding distance is smaller than SAFE_DISTANCE, reduce speed
-            if bounding_dist < SAFE_DISTANCE:
-                # Decelerate or match front car's speed
-                self.speed = min(self.speed, front_car.speed)
-
-                # Also ensure we do NOT overlap physically
-                # (if bounding_dist < 0, it means we overlapped)
-                overlap_amount = SAFE_DISTANCE - bounding_dist
-                if overlap_amount > 0:  
-                    # We forcibly move this car back a bit to prevent actual overlap
-                    if self.lane_index == 0:
-                        # Upward lane => move car down
-                        self.y += overlap_amount
-                    else:
-                        # Downward lane => move car up
-                        self.y -= overlap_amount
-            else:
-                # No risk => maintain base speed (no acceleration beyond base).
-                self.speed = self.base_speed
-        else:
-            # No car in front => maintain base speed
-            self.speed = self.base_speed
-
-        # Update position based on lane direction
-        if self.lane_index == 0:
-            # Upward lane (y decreases)
-            self.y -= self.speed
-            if self.y < -100:
-                self.y = SCREEN_HEIGHT + 100
-        else:
-            # Downward lane (y increases)
-            self.y += self.speed
-            if self.y > SCREEN_HEIGHT + 100:
-                self.y = -100
-
-    def get_front_car_bounding_distance(self, vehicles):
-        """
-        Returns (closest_front_car, bounding_dist) in the same lane.
-        
-        'bounding_dist' is the distance from this car’s *front edge* 
-        to the front car’s *rear edge*, which better prevents overlap.
-        
-          - For the upward lane (lane_index=0), front edge is 'y',
-            while the front car's rear edge is 'front_car.y + front_car.height'.
-          - For the downward lane (lane_index=1), front edge is 'y + height',
-            while the front car's rear edge is just 'front_car.y'.
-
-        A positive bounding_dist means there's space; 
-        a negative or zero bounding_dist would imply overlap or touching.
-        """
-        front_car = None
-        min_dist = float('inf')
-
-        # Identify this car's front edge
-        if self.lane_index == 0:
-            # Up-lane => front edge = self.y
-            behind_front_edge = self.y
-        else:
-            # Down-lane => front edge = self.y + self.height
-            behind_front_edge = self.y + self.height
-
-        for v in vehicles:
-            if v is self:
-                continue
-            if v.lane_index == self.lane_index:
-                # Same lane
-                if self.lane_index == 0:
-                    # Upward lane => front car has smaller y => v.y < self.y
-                    if v.y < self.y:
-                        # front car's rear edge = v.y + v.height
-                        front_car_rear_edge = v.y + v.height
-                        dist = behind_front_edge - front_car_rear_edge
-
-                        if 0 <= dist < min_dist:
-                            # 0 <= dist means no overlap yet, and it's the closest so far
-                            min_dist = dist
-                            front_car = v
-
-                else:
-                    # Downward lane => front car has larger y => v.y > self.y
-                    if v.y > self.y:
-                        # front car's rear edge = v.y
-                        front_car_rear_edge = v.y
-                        dist = front_car_rear_edge - behind_front_edge
-
-                        if 0 <= dist < min_dist:
-                            min_dist = dist
-                            front_car = v
-
-        if front_car is not None:
-            return (front_car, min_dist)
-        return (None, float('inf'))
-
     def draw(self):
         """
         Draw the vehicle with a capsule shape (rectangle + ellipses).
+        Returns the screen rects it touched.
         """
-        rect_x = self.x - self.width / 2
-        rect_y = self.y
+        # Quantize once: the physics keeps float positions, pygame gets ints
+        ix, iy = int(self.x), int(self.y)
+        rect_x = ix - self.width // 2
+        rect_y = iy
         rect_w = self.width
         rect_h = self.height
 
         # Main rectangle
-        pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, rect_w, rect_h))
+        body_rect = pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, rect_w, rect_h))
 
         # Top ellipse
-        pygame.draw.ellipse(
+        top_rect = pygame.draw.ellipse(
             SCREEN,
             self.color,
-            (rect_x, rect_y - rect_w / 2, rect_w, rect_w)
+            (rect_x, rect_y - rect_w // 2, rect_w, rect_w)
         )
         # Bottom ellipse
-        pygame.draw.ellipse(
+        bottom_rect = pygame.draw.ellipse(
             SCREEN,
             self.color,
-            (rect_x, rect_y + rect_h - rect_w / 2, rect_w, rect_w)
+            (rect_x, rect_y + rect_h - rect_w // 2, rect_w, rect_w)
         )
 
         # Center line detail (for visual)
         pygame.draw.line(
             SCREEN,
             (0, 0, 0),
-            (self.x, self.y + 5),
-            (self.x, self.y + rect_h - 5),
+            (ix, iy + 5),
+            (ix, iy + rect_h - 5),
             2
         )
+        return [body_rect, top_rect, bottom_rect]
 
     def draw_cone(self, vehicles):
         """
@@ -278,55 +422,36 @@ class Vehicle:
          - Turn it RED if another car is within DETECTION_DISTANCE (by bounding distance),
          - Otherwise GREEN.
         Also display the bounding distance to that closest front car (if inside cone).
+        Returns the screen rects it touched.
         """
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
+        # Reuse the reading taken during the update; 'vehicles' is kept for compatibility.
+        front_car, bounding_dist = self._last_front
 
         # Determine whether the cone should be red or green
-        cone_color_rgba = (*GREEN, 60)  # default translucent green
+        is_red = False
         dist_text_value = None
 
         # If we have a front car and bounding_dist < DETECTION_DISTANCE, turn cone red
         if front_car is not None and bounding_dist < DETECTION_DISTANCE:
-            cone_color_rgba = (*RED, 60)
+            is_red = True
             dist_text_value = bounding_dist
 
-        # Prepare a surface for the cone
-        cone_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-
         # For the cone shape, we project forward in the lane direction
-        if self.lane_index == 1:
-            # Downward lane: cone fans out downward
-            cone_start = (self.x, self.y + self.height)
-            left_spread = (self.x - 80, self.y + self.height + 250)
-            right_spread = (self.x + 80, self.y + self.height + 250)
-        else:
-            # Upward lane: cone fans out upward
-            cone_start = (self.x, self.y)
-            left_spread = (self.x - 80, self.y - 250)
-            right_spread = (self.x + 80, self.y - 250)
-
-        pygame.draw.polygon(
-            cone_surface,
-            cone_color_rgba,
-            [cone_start, left_spread, right_spread]
-        )
-
-        SCREEN.blit(cone_surface, (0, 0))
+        lane = self.lane_index
+        cone_sprite = (self.CONE_SPRITES_RED if is_red else self.CONE_SPRITES_GREEN)[lane]
+        dx, dy = self.CONE_OFFSETS[lane]
+        ix, iy = int(self.x), int(self.y)
+        dirty = [SCREEN.blit(cone_sprite, (ix + dx, iy + dy))]
 
         # If there's a front car within detection range, display bounding distance
         if dist_text_value is not None:
-            font = pygame.font.SysFont(None, 20)
-            dist_text = font.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
+            dist_text = _FONT_20.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
 
             # Put the text near the start of the cone
-            if self.lane_index == 1:
-                # For downward lane
-                text_pos = (cone_start[0] + 5, cone_start[1] + 5)
-            else:
-                # For upward lane
-                text_pos = (cone_start[0] + 5, cone_start[1] - 20)
+            dx, dy = self.LABEL_OFFSETS[lane]
+            dirty.append(SCREEN.blit(dist_text, (ix + dx, iy + dy)))
 
-            SCREEN.blit(dist_text, text_pos)
+        return dirty
 
 
 # --------------------------------------------------
@@ -343,36 +468,102 @@ def main():
 
     vehicles = [red_car, blue_car, green_car, orange_car]
 
+    # SoA state: these arrays drive the simulation and the Vehicle objects
+    # are refreshed from them each tick for drawing.
+    ys = np.array([v.y for v in vehicles], dtype=float)
+    speeds = np.array([v.speed for v in vehicles], dtype=float)
+    base_speeds = np.array([v.base_speed for v in vehicles], dtype=float)
+    heights = np.array([v.height for v in vehicles], dtype=float)
+    lanes = np.array([v.lane_index for v in vehicles])
+    down = lanes == 1
+
+    # Large fleets run on the GPU; drawing stays on the CPU, so the results
+    # are copied back once per frame.
+    use_gpu = cp is not None and len(vehicles) > GPU_VEHICLE_THRESHOLD
+    xp = cp if use_gpu else np
+    if use_gpu:
+        ys, speeds, base_speeds, heights, lanes, down = (
+            cp.asarray(a) for a in (ys, speeds, base_speeds, heights, lanes, down))
+    step = _step_array if use_gpu else _step
+
+    # Large fleets without a GPU are split across CPU threads instead
+    pool = None
+    if not use_gpu and HAVE_NUMBA and len(vehicles) > PARALLEL_VEHICLE_THRESHOLD:
+        pool = ThreadPoolExecutor(PARTITIONS)
+        step = partial(_step_parallel, pool)
+
+    # The screen starts as the full background; after that only the regions
+    # that change are repainted and pushed to the display.
+    SCREEN.blit(BACKGROUND, (0, 0))
+    pygame.display.flip()
+    prev_dirty = []
+    hud_speeds = None
+    hud = None
+
+    # Only QUIT and VIDEOEXPOSE are handled, so keep everything else out of
+    # the queue. VIDEOEXPOSE matters because only dirty rects are presented:
+    # once the window is uncovered or restored, the whole frame must be redrawn.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.VIDEOEXPOSE])
+
     running = True
     while running:
         clock.tick(FPS)
-        for event in pygame.event.get():
+        # A filtered get() pumps SDL and returns only the events handled here
+        exposed = False
+        for event in pygame.event.get([pygame.QUIT, pygame.VIDEOEXPOSE]):
             if event.type == pygame.QUIT:
                 running = False
-
-        # Update each vehicle
-        for v in vehicles:
-            v.update(vehicles)
-
-        # Draw scene
-        draw_road()
-        draw_trees_and_signs()
+            else:
+                exposed = True
+
+        # Prepare phase: find every car's front car at once
+        rears = xp.where(down, ys, -(ys + heights))
+        fronts = xp.where(down, ys + heights, -ys)
+        front_idx, front_dist = find_front_cars(rears, fronts, lanes)
+
+        # Update phase: advance all vehicles in one compiled pass
+        step(ys, speeds, base_speeds, lanes, front_idx, front_dist, SAFE_DISTANCE, SCREEN_HEIGHT)
+
+        # Copy the new state back onto the vehicles for drawing
+        # (tolist() also brings CuPy arrays back to the host)
+        for v, y, speed, j, dist in zip(vehicles, ys.tolist(), speeds.tolist(),
+                                        front_idx.tolist(), front_dist.tolist()):
+            v.y = y
+            v.speed = speed
+            v._last_front = (vehicles[j] if j >= 0 else None, dist)
+
+        # Draw scene: erase last frame's cars, cones and HUD by
+        # restoring the background underneath them (all of it after an expose)
+        if exposed:
+            SCREEN.blit(BACKGROUND, (0, 0))
+        else:
+            for rect in prev_dirty:
+                SCREEN.blit(BACKGROUND, rect, rect)
+        dirty = []
 
         # Draw vehicles and cones
         for v in vehicles:
-            v.draw()
-            v.draw_cone(vehicles)
+            dirty.extend(v.draw())
+            dirty.extend(v.draw_cone(vehicles))
 
         # Show the speeds of each car on the screen
-        font = pygame.font.SysFont(None, 28)
-        y_offset = 10
-        for i, v in enumerate(vehicles):
-            txt = font.render(f"Car {i+1} Speed: {v.speed:.1f}", True, (0, 0, 0))
-            SCREEN.blit(txt, (10, y_offset))
-            y_offset += 30
-
-        pygame.display.flip()
+        shown_speeds = [v.speed for v in vehicles]
+        if shown_speeds != hud_speeds:
+            hud = render_speed_hud(shown_speeds)
+            hud_speeds = shown_speeds
+        dirty.append(SCREEN.blit(hud, (10, 10)))
+
+        # Present the erased regions along with the newly drawn ones, or the
+        # whole frame if the window contents were lost
+        if exposed:
+            pygame.display.flip()
+        else:
+            pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
 
+    if pool is not None:
+        pool.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import pygame
-import random
+import numpy as np
 
 pygame.init()
 
@@ -37,21 +37,62 @@ RED = (255, 0, 0)
 SAFE_DISTANCE = 100         # If front car is within this bounding distance, slow down.
 DETECTION_DISTANCE = 150    # If front car is within this bounding distance, cone goes red.
 OVERTAKE_DISTANCE = 200      # Distance to check for overtaking
+GRID_CELL = 256             # Cell width of the spatial grid used for overtaking checks
+
+# Front distance reported when there is no car ahead. Any real gap is shorter
+# (cars wrap 100 px past either edge), so a finite value keeps every distance
+# comparison on bounded numbers.
+_INF = SCREEN_WIDTH * 2.0
+
+# --------------------------------------------------
+# Fonts
+# --------------------------------------------------
+# Built once at import; SysFont lookups are far too slow to repeat per frame.
+_FONT_20 = pygame.font.SysFont(None, 20)
+_FONT_24 = pygame.font.SysFont(None, 24)
+_FONT_28 = pygame.font.SysFont(None, 28)
+_FONTS = {20: _FONT_20, 24: _FONT_24, 28: _FONT_28}
+
+# Rendered labels that never change (vehicle names, sign text),
+# keyed by (text, size, color).
+_STATIC_TEXT_CACHE = {}
 
 # --------------------------------------------------
 # Helper Functions
 # --------------------------------------------------
-def draw_road():
-    SCREEN.fill(GRASS_COLOR)  # Grass background
+def render_static_text(text, size, color):
+    """
+    Return a rendered Surface for a label that does not change between frames.
+    """
+    key = (text, size, color)
+    surf = _STATIC_TEXT_CACHE.get(key)
+    if surf is None:
+        surf = _FONTS[size].render(text, True, color).convert_alpha()
+        _STATIC_TEXT_CACHE[key] = surf
+    return surf
+
+def render_speed_hud(speeds):
+    """
+    Render the per-car speed lines onto one Surface, so the HUD is a single
+    blit and only needs redrawing when a speed changes.
+    """
+    hud = pygame.Surface((220, 30 * len(speeds)), pygame.SRCALPHA)
+    for i, speed in enumerate(speeds):
+        txt = _FONT_28.render(f"Car {i+1} Speed: {speed:.1f}", True, (0, 0, 0))
+        hud.blit(txt, (0, 30 * i))
+    return hud.convert_alpha()
+
+def draw_road(surface):
+    surface.fill(GRASS_COLOR)  # Grass background
     pygame.draw.rect(
-        SCREEN,
+        surface,
         ROAD_COLOR,
         (ROAD_LEFT, ROAD_CENTER_Y - LANE_WIDTH // 2, ROAD_RIGHT, LANE_WIDTH)
     )
-    pygame.draw.line(SCREEN, WHITE, (ROAD_LEFT, ROAD_TOP), (ROAD_RIGHT, ROAD_TOP), 4)
-    pygame.draw.line(SCREEN, WHITE, (ROAD_LEFT, ROAD_BOTTOM), (ROAD_RIGHT, ROAD_BOTTOM), 4)
+    pygame.draw.line(surface, WHITE, (ROAD_LEFT, ROAD_TOP), (ROAD_RIGHT, ROAD_TOP), 4)
+    pygame.draw.line(surface, WHITE, (ROAD_LEFT, ROAD_BOTTOM), (ROAD_RIGHT, ROAD_BOTTOM), 4)
 
-def draw_trees():
+def draw_trees(surface):
     # Draw trees on the sides of the road
     tree_positions = [(100, 100), (200, 100), (100, 500),
                       (SCREEN_WIDTH - 100, 100), (SCREEN_WIDTH - 200, 100), (SCREEN_WIDTH - 100, 500)]
@@ -61,14 +102,162 @@ def draw_trees():
         leaves_color = (0, 100, 0)
         trunk_w, trunk_h = 10, 30
         # Draw trunk
-        pygame.draw.rect(SCREEN, trunk_color, (tx, ty, trunk_w, trunk_h))
+        pygame.draw.rect(surface, trunk_color, (tx, ty, trunk_w, trunk_h))
         # Draw leaves
-        pygame.draw.circle(SCREEN, leaves_color, (tx + trunk_w // 2, ty), 20)
+        pygame.draw.circle(surface, leaves_color, (tx + trunk_w // 2, ty), 20)
+
+def _build_background(surface):
+    """
+    Rasterize the static scenery once; the main loop only blits the result.
+    """
+    draw_road(surface)
+    draw_trees(surface)
+
+# Opaque and in the display pixel format, so the per-frame blit is a plain copy.
+BACKGROUND = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+_build_background(BACKGROUND)
+
+def _bake_cone(color, points, size):
+    """
+    Draw one translucent cone into a small sprite so draw_cone only has to blit it.
+    """
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(surf, (*color, 60), points)
+    return surf.convert_alpha()
+
+# Cone sprites: apex at the middle of the left edge, fanning 250 px forward
+# and 80 px to either side.
+_CONE_POINTS = [(0, 80), (250, 0), (250, 160)]
+CONE_GREEN = _bake_cone(GREEN, _CONE_POINTS, (251, 161))
+CONE_RED = _bake_cone(RED, _CONE_POINTS, (251, 161))
+
+# --------------------------------------------------
+# Front-Car Search
+# --------------------------------------------------
+def find_front_cars(xs, widths):
+    """
+    Find every vehicle's front car from SoA position arrays, without branches.
+
+    Sort the vehicles by x once, then binary-search that order for the first
+    car whose rear bumper is at or past each car's front bumper. Cars with no
+    such car ahead are masked out with np.where rather than an if per car.
+
+    Returns (front_idx, front_dist): the index of the closest car ahead whose
+    rear bumper is at or past this car's front bumper, and the bounding
+    distance to it. front_idx is -1 (and front_dist _INF) when there is none.
+    """
+    n = len(xs)
+    order = np.argsort(xs, kind="stable")
+    sorted_xs = xs[order]
+    front_edges = xs + widths
+    pos = np.searchsorted(sorted_xs, front_edges, side="left")
+    has_front = pos < n
+    pos = np.minimum(pos, n - 1)
+    front_idx = np.where(has_front, order[pos], -1)
+    front_dist = np.where(has_front, sorted_xs[pos] - front_edges, _INF)
+    return front_idx, front_dist
+
+def build_grid(vehicles, xs):
+    """
+    Bucket vehicles into a uniform 1D grid along the road, keyed by
+    x // GRID_CELL, so range queries only visit the cells they overlap.
+    """
+    grid = {}
+    for v, x in zip(vehicles, xs.tolist()):
+        grid.setdefault(int(x // GRID_CELL), []).append(v)
+    return grid
+
+# --------------------------------------------------
+# Role Updates
+# --------------------------------------------------
+# One update per driving role, bound to each Vehicle as its update() method.
+# All take (vehicles, front_car, front_x, bounding_dist, grid), where front_x
+# is the front car's position at the start of the tick: the front car may
+# already have moved (or wrapped) this tick, so its live x would not match
+# bounding_dist.
+def _update_overtaker(self, vehicles, front_car, front_x, bounding_dist, grid):
+    # Only Car 2 (Blue Car) will attempt to overtake
+    self._last_front = (front_car, bounding_dist)
+
+    if front_car is not None:
+        if bounding_dist < SAFE_DISTANCE:
+            # Prevent overlap by stopping at the safe distance
+            self.x = front_x - self.width - SAFE_DISTANCE
+            self.speed = 0  # Stop if too close
+        elif bounding_dist < DETECTION_DISTANCE:
+            self.speed = self.base_speed * 0.5  # Slow down if within detection distance
+        else:
+            self.speed = self.base_speed
+
+        # Check for overtaking
+        if self.can_overtake(grid):
+            self.is_overtaking = True
+            self.overtake()
+        else:
+            self.is_overtaking = False
+    else:
+        self.speed = self.base_speed
+        self.is_overtaking = False
+
+    _advance(self, grid)
+
+def _update_follower(self, vehicles, front_car, front_x, bounding_dist, grid):
+    # Car 1: keep the safe distance, otherwise cruise at base speed
+    self._last_front = (front_car, bounding_dist)
+
+    if front_car is not None:
+        if bounding_dist < SAFE_DISTANCE:
+            self.x = front_x - self.width - SAFE_DISTANCE
+            self.speed = 0  # Stop if too close
+        else:
+            self.speed = self.base_speed
+
+    _advance(self, grid)
+
+def _update_accelerator(self, vehicles, front_car, front_x, bounding_dist, grid):
+    # Car 3 follows like Car 1, but accelerates if there is space
+    self._last_front = (front_car, bounding_dist)
+
+    if front_car is not None:
+        if bounding_dist < SAFE_DISTANCE:
+            self.x = front_x - self.width - SAFE_DISTANCE
+            self.speed = 0  # Stop if too close
+        else:
+            self.speed = self.base_speed
+
+    if front_car is None or (front_x - self.x > 150):  # Check if there's enough space
+        self.speed = self.base_speed + 1  # Accelerate
+
+    _advance(self, grid)
+
+def _advance(self, grid):
+    # Move to the right (increasing x)
+    self.x += self.speed
+    if self.x > SCREEN_WIDTH + 100:
+        self.x = -100
+        # Rebucket the car, or windows near the left edge would miss it until
+        # the next tick. The entry in its old cell can stay: can_overtake
+        # checks live positions, so it is just one extra visit.
+        grid.setdefault(int(self.x // GRID_CELL), []).append(self)
+
+    # Keep the vehicle within the road boundaries
+    self.y = max(ROAD_TOP + SAFE_EDGE_DISTANCE, min(self.y, ROAD_BOTTOM - SAFE_EDGE_DISTANCE))
+
+_ROLE_UPDATES = {"Blue Car": _update_overtaker, "Green Car": _update_accelerator}
 
 # --------------------------------------------------
 # Vehicle Class
 # --------------------------------------------------
 class Vehicle:
+    # Fixed attribute slots: no per-instance __dict__, and faster attribute access.
+    __slots__ = ('x', 'y', 'color', 'base_speed', 'speed', 'width', 'height', 'name',
+                 'is_overtaking', '_last_front', 'update')
+
+    # Where the cone sprite and distance label go, relative to the front bumper
+    # (x + width, y); fixed for every car, so draw_cone only adds them.
+    CONE_OFFSET = (0, -80)
+    LABEL_OFFSET = (5, 5)
+
     def __init__(self, x, color, base_speed, name):
         self.x = x
         self.y = ROAD_CENTER_Y
@@ -79,59 +268,27 @@ class Vehicle:
         self.height = 30
         self.name = name  # Add name attribute
         self.is_overtaking = False  # Track if the vehicle is overtaking
-
-    def update(self, vehicles):
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
-
-        if self.name == "Blue Car":  # Only Car 2 (Blue Car) will attempt to overtake
-            if front_car is not None:
-                if bounding_dist < SAFE_DISTANCE:
-                    # Prevent overlap by stopping at the safe distance
-                    self.x = front_car.x - self.width - SAFE_DISTANCE
-                    self.speed = 0  # Stop if too close
-                elif bounding_dist < DETECTION_DISTANCE:
-                    self.speed = self.base_speed * 0.5  # Slow down if within detection distance
-                else:
-                    self.speed = self.base_speed
-
-                # Check for overtaking
-                if self.can_overtake(vehicles):
-                    self.is_overtaking = True
-                    self.overtake()
-                else:
-                    self.is_overtaking = False
-            else:
-                self.speed = self.base_speed
-                self.is_overtaking = False
-
-        else:  # For Car 1 and Car 3
-            if front_car is not None:
-                if bounding_dist < SAFE_DISTANCE:
-                    self.x = front_car.x - self.width - SAFE_DISTANCE
-                    self.speed = 0  # Stop if too close
-                else:
-                    self.speed = self.base_speed
-
-            # Car 3 accelerates if there is space
-            if self.name == "Green Car":
-                if front_car is None or (front_car.x - self.x > 150):  # Check if there's enough space
-                    self.speed = self.base_speed + 1  # Accelerate
-
-        # Move to the right (increasing x)
-        self.x += self.speed
-        if self.x > SCREEN_WIDTH + 100:
-            self.x = -100
-
-        # Keep the vehicle within the road boundaries
-        self.y = max(ROAD_TOP + SAFE_EDGE_DISTANCE, min(self.y, ROAD_BOTTOM - SAFE_EDGE_DISTANCE))
-
-    def can_overtake(self, vehicles):
-        # Check if there's enough space to overtake
-        for v in vehicles:
-            if v is self:
-                continue
-            if v.x > self.x and v.x < self.x + OVERTAKE_DISTANCE:
-                return False  # Not enough space to overtake
+        self._last_front = (None, _INF)  # Reused by draw_cone
+        # Each role's update is picked once here, so update() itself never
+        # has to compare names.
+        role_update = _ROLE_UPDATES.get(name, _update_follower)
+        self.update = role_update.__get__(self)
+
+    def can_overtake(self, grid):
+        # Check if there's enough space to overtake, visiting only the grid
+        # cells that overlap the overtaking window. The grid was built at the
+        # start of the tick, so also look one cell either side: cars may have
+        # since moved forward into the window, or been pulled back into it by
+        # the safe-distance clamp (at most SAFE_DISTANCE, under one cell).
+        # Cars that wrap to the left edge are rebucketed by _advance.
+        first_cell = int(self.x // GRID_CELL) - 1
+        last_cell = int((self.x + OVERTAKE_DISTANCE) // GRID_CELL) + 1
+        for cell in range(first_cell, last_cell + 1):
+            for v in grid.get(cell, ()):
+                if v is self:
+                    continue
+                if v.x > self.x and v.x < self.x + OVERTAKE_DISTANCE:
+                    return False  # Not enough space to overtake
         return True  # Safe to overtake
 
     def overtake(self):
@@ -147,59 +304,41 @@ class Vehicle:
         if self.x > 600:  # Assuming the overtaking is done after reaching a certain x position
             self.y += 1  # Move downward to return to the lane
 
-    def get_front_car_bounding_distance(self, vehicles):
-        front_car = None
-        min_dist = float('inf')
-        behind_front_edge = self.x + self.width
-
-        for v in vehicles:
-            if v is self:
-                continue
-            if v.x > self.x:
-                dist = v.x - behind_front_edge
-                if 0 <= dist < min_dist:
-                    min_dist = dist
-                    front_car = v
-
-        if front_car is not None:
-            return (front_car, min_dist)
-        return (None, float('inf'))
-
     def draw(self):
-        # Draw a more car-like shape
-        rect_x = self.x
-        rect_y = self.y - self.height / 2
-        pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, self.width, self.height))
+        # Draw a more car-like shape; returns the screen rects it touched
+        # Quantize once: the physics keeps float positions, pygame gets ints
+        ix, iy = int(self.x), int(self.y)
+        rect_x = ix
+        rect_y = iy - self.height // 2
+        body_rect = pygame.draw.rect(SCREEN, self.color, (rect_x, rect_y, self.width, self.height))
         pygame.draw.rect(SCREEN, (0, 0, 0), (rect_x + 5, rect_y + 5, self.width - 10, self.height - 10))  # Inner rectangle for detail
 
         # Draw the name of the vehicle
-        font = pygame.font.SysFont(None, 24)
-        name_text = font.render(self.name, True, (0, 0, 0))
-        SCREEN.blit(name_text, (self.x + 5, self.y - self.height / 2 + 5))
+        name_text = render_static_text(self.name, 24, (0, 0, 0))
+        name_rect = SCREEN.blit(name_text, (rect_x + 5, rect_y + 5))
+        return [body_rect, name_rect]
 
     def draw_cone(self, vehicles):
-        front_car, bounding_dist = self.get_front_car_bounding_distance(vehicles)
+        # Returns the screen rects it touched.
+        # Reuse the reading taken during the update; 'vehicles' is kept for compatibility.
+        front_car, bounding_dist = self._last_front
 
-        cone_color_rgba = (*GREEN, 60)
+        cone_sprite = CONE_GREEN
         dist_text_value = None
 
         if front_car is not None and bounding_dist < DETECTION_DISTANCE:
-            cone_color_rgba = (*RED, 60)
+            cone_sprite = CONE_RED
             dist_text_value = bounding_dist
 
-        cone_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        cone_start = (self.x + self.width, self.y)
-        left_spread = (self.x + self.width + 250, self.y - 80)
-        right_spread = (self.x + self.width + 250, self.y + 80)
-
-        pygame.draw.polygon(cone_surface, cone_color_rgba, [cone_start, left_spread, right_spread])
-        SCREEN.blit(cone_surface, (0, 0))
+        front_x, iy = int(self.x) + self.width, int(self.y)
+        dx, dy = self.CONE_OFFSET
+        dirty = [SCREEN.blit(cone_sprite, (front_x + dx, iy + dy))]
 
         if dist_text_value is not None:
-            font = pygame.font.SysFont(None, 20)
-            dist_text = font.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
-            text_pos = (cone_start[0] + 5, cone_start[1] + 5)
-            SCREEN.blit(dist_text, text_pos)
+            dist_text = _FONT_20.render(f"Dist: {dist_text_value:.1f}", True, (0, 0, 0))
+            dx, dy = self.LABEL_OFFSET
+            dirty.append(SCREEN.blit(dist_text, (front_x + dx, iy + dy)))
+        return dirty
 
 # --------------------------------------------------
 # Main Loop
@@ -214,35 +353,74 @@ def main():
 
     vehicles = [red_car, blue_car, green_car]
 
+    # SoA arrays for the per-tick front-car search
+    xs = np.empty(len(vehicles))
+    widths = np.array([v.width for v in vehicles], dtype=float)
+
+    # The screen starts as the full background; after that only the regions
+    # that change are repainted and pushed to the display.
+    SCREEN.blit(BACKGROUND, (0, 0))
+    pygame.display.flip()
+    prev_dirty = []
+    hud_speeds = None
+    hud = None
+
+    # Only QUIT and VIDEOEXPOSE are handled, so keep everything else out of
+    # the queue. VIDEOEXPOSE matters because only dirty rects are presented:
+    # once the window is uncovered or restored, the whole frame must be redrawn.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.VIDEOEXPOSE])
+
     running = True
     while running:
         clock.tick(FPS)
-        for event in pygame.event.get():
+        # A filtered get() pumps SDL and returns only the events handled here
+        exposed = False
+        for event in pygame.event.get([pygame.QUIT, pygame.VIDEOEXPOSE]):
             if event.type == pygame.QUIT:
                 running = False
+            else:
+                exposed = True
 
-        # Update each vehicle
-        for v in vehicles:
-            v.update(vehicles)
-
-        # Draw scene elements
-        draw_road()
-        draw_trees()
+        # Prepare phase: snapshot positions and find all front cars at once
+        for i, v in enumerate(vehicles):
+            xs[i] = v.x
+        front_idx, front_dist = find_front_cars(xs, widths)
+        front_xs = xs[front_idx]  # unused where front_idx is -1 (no front car)
+        grid = build_grid(vehicles, xs)
+
+        # Update each vehicle; every front-car reading comes from the snapshot
+        for v, j, front_x, dist in zip(vehicles, front_idx.tolist(), front_xs.tolist(), front_dist.tolist()):
+            v.update(vehicles, vehicles[j] if j >= 0 else None, front_x, dist, grid)
+
+        # Draw scene elements: erase last frame's cars, cones and HUD by
+        # restoring the background underneath them (all of it after an expose)
+        if exposed:
+            SCREEN.blit(BACKGROUND, (0, 0))
+        else:
+            for rect in prev_dirty:
+                SCREEN.blit(BACKGROUND, rect, rect)
+        dirty = []
 
         # Draw vehicles and their cones
         for v in vehicles:
-            v.draw()
-            v.draw_cone(vehicles)
+            dirty.extend(v.draw())
+            dirty.extend(v.draw_cone(vehicles))
 
         # Display the speeds of each car on the screen
-        font = pygame.font.SysFont(None, 28)
-        y_offset = 10
-        for i, v in enumerate(vehicles):
-            txt = font.render(f"Car {i+1} Speed: {v.speed:.1f}", True, (0, 0, 0))
-            SCREEN.blit(txt, (10, y_offset))
-            y_offset += 30
-
-        pygame.display.flip()
+        shown_speeds = [v.speed for v in vehicles]
+        if shown_speeds != hud_speeds:
+            hud = render_speed_hud(shown_speeds)
+            hud_speeds = shown_speeds
+        dirty.append(SCREEN.blit(hud, (10, 10)))
+
+        # Present the erased regions along with the newly drawn ones, or the
+        # whole frame if the window contents were lost
+        if exposed:
+            pygame.display.flip()
+        else:
+            pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
 
     pygame.quit()
 
@@ -1,7 +1,16 @@
 import pygame
-import math
+import numpy as np
 import random
-from collections import deque
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the kernels then run as plain Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
 
 # Initialize Pygame
 pygame.init()
@@ -10,6 +19,17 @@ pygame.init()
 WIDTH, HEIGHT = 800, 600
 FPS = 60
 
+# Simulation ticks per second. Speeds are in pixels per tick, so this also
+# sets how fast the scene moves; rendering runs at FPS and interpolates
+# between ticks, so the two rates are independent.
+SIM_HZ = FPS
+SIM_DT = 1000 / SIM_HZ  # milliseconds per tick
+MAX_TICKS_PER_FRAME = 5  # catch-up limit after a stall
+
+# Above this many vehicles a Fleet advances them with one compiled parallel
+# kernel; for a handful of cars the per-call overhead outweighs the gain.
+FLEET_VEHICLE_THRESHOLD = 1000
+
 ROAD_TOP = 100
 ROAD_BOTTOM = HEIGHT - 50
 LANE_WIDTH = 200
@@ -22,10 +42,39 @@ UNSAFE_DISTANCE_LINE_COLOR = (255, 0, 0)
 ROAD_COLOR = (50, 50, 50)
 GRASS_COLOR = (34, 139, 34)
 
+# Plot label font, created on first use when no font is passed in
+_plot_font = None
+
+# Recently rendered text surfaces, keyed by (font, text, color). The speed
+# labels show one decimal, so most frames repeat one of the last few strings.
+_TEXT_CACHE = {}
+_TEXT_CACHE_SIZE = 8
+
+# Reused pixel-coordinate buffer for the plot line, one row per history entry
+_PLOT_PTS = np.empty((100, 2), dtype=np.int32)
+
+def _move_down(y, speed, height, screen_height):
+    """
+    Move one car down by its speed, wrapping it back to the top once it has
+    left the bottom. Returns (new y, previous y for interpolation).
+    """
+    new_y = y + speed
+    if new_y > screen_height + height:
+        new_y = -height
+        return new_y, new_y  # don't interpolate across the wrap
+    return new_y, y
+
+# Compiled copy of _move_down for _advance; Vehicle.update keeps the plain one
+_move_down_jit = njit(cache=True)(_move_down)
+
 class Vehicle:
     def __init__(self, x, y, color, max_speed):
         self.x = x
         self.y = y
+        # Position at the previous tick, and the interpolated pixel row drawn
+        # this frame (physics stays in floats; drawing uses ints)
+        self.prev_y = y
+        self.draw_y = int(y)
         self.color = color
         self.speed = 0
         self.max_speed = max_speed
@@ -36,33 +85,92 @@ class Vehicle:
         self.height = 60  # length
         # Use angle 0 for forward. We can rotate if we want turning in the future.
         self.angle = 0
+
+        # The car's look never changes, so it is rasterized once (on the first
+        # draw, when the display exists) and blitted from then on.
+        self._sprite = None
     
     def update(self):
-        self.y += self.speed  # move down the screen
+        # Move down the screen, resetting to the top once past the bottom
+        self.y, self.prev_y = _move_down(self.y, self.speed, self.height, HEIGHT)
 
-        # Reset position if car reaches bottom (for the blue car, or just demonstration)
-        if self.y > HEIGHT + self.height:
-            self.y = -self.height
+    def interpolate(self, alpha):
+        # Place the car alpha of the way from its previous tick to its current one
+        self.draw_y = int(self.prev_y + alpha * (self.y - self.prev_y))
 
     def draw(self, screen):
         """
         Draw a simple top-down car as a polygon:
             - A main rectangle with a slight trapezoid shape for interest
+        Returns the screen rect it touched.
+        """
+        if self._sprite is None:
+            self._sprite = self._build_sprite()
+        # Car center = (self.x, self.draw_y); the sprite's top-center sits there
+        return screen.blit(self._sprite, (int(self.x) - self.width // 2, self.draw_y))
+
+    def _build_sprite(self):
+        """
+        Render the car body and headlights into a sprite whose top-center is
+        the car's (x, y).
         """
-        # Car center = (self.x, self.y)
-        # We'll define corners relative to center, then rotate (if needed).
+        half_w = self.width / 2
+        sprite = pygame.Surface((self.width + 1, self.height + 1), pygame.SRCALPHA)
+
+        # Corners relative to the top-center, shifted into sprite coordinates.
         # But for simplicity, no rotation if angle=0.
-        top_left     = (self.x - self.width/2, self.y)
-        top_right    = (self.x + self.width/2, self.y)
-        bottom_right = (self.x + self.width/2.5, self.y + self.height)
-        bottom_left  = (self.x - self.width/2.5, self.y + self.height)
+        top_left     = (0, 0)
+        top_right    = (self.width, 0)
+        bottom_right = (half_w + self.width/2.5, self.height)
+        bottom_left  = (half_w - self.width/2.5, self.height)
 
-        pygame.draw.polygon(screen, self.color, [top_left, top_right, bottom_right, bottom_left])
+        pygame.draw.polygon(sprite, self.color, [top_left, top_right, bottom_right, bottom_left])
         
         # Optional: add some small “headlights” or “tail-lights” if you like
         headlight_radius = 4
-        pygame.draw.circle(screen, (255, 255, 224), (int(self.x - self.width/4), int(self.y + 5)), headlight_radius)
-        pygame.draw.circle(screen, (255, 255, 224), (int(self.x + self.width/4), int(self.y + 5)), headlight_radius)
+        pygame.draw.circle(sprite, (255, 255, 224), (int(half_w - self.width/4), 5), headlight_radius)
+        pygame.draw.circle(sprite, (255, 255, 224), (int(half_w + self.width/4), 5), headlight_radius)
+        return sprite.convert_alpha()
+
+
+@njit(parallel=True, cache=True)
+def _advance(ys, prev_ys, speeds, heights, screen_height):
+    """
+    Move every car down by its speed, in place, wrapping cars that leave the
+    bottom back to the top (the array form of Vehicle.update).
+    """
+    for i in prange(ys.shape[0]):
+        ys[i], prev_ys[i] = _move_down_jit(ys[i], speeds[i], heights[i], screen_height)
+
+
+class Fleet:
+    """
+    Advances a group of vehicles each tick. Small groups just update each
+    Vehicle in turn; above FLEET_VEHICLE_THRESHOLD the positions and speeds
+    live in NumPy arrays that one compiled kernel advances together, and the
+    Vehicle objects are refreshed from them for sensing and drawing.
+    """
+    def __init__(self, vehicles):
+        self.vehicles = vehicles
+        self.use_kernel = len(vehicles) > FLEET_VEHICLE_THRESHOLD
+        if self.use_kernel:
+            self.ys = np.array([v.y for v in vehicles], dtype=float)
+            self.prev_ys = np.array([v.prev_y for v in vehicles], dtype=float)
+            self.speeds = np.zeros(len(vehicles))
+            self.heights = np.array([v.height for v in vehicles], dtype=float)
+
+    def update(self):
+        if not self.use_kernel:
+            for v in self.vehicles:
+                v.update()
+            return
+        # Take this tick's speeds, advance every car at once, then copy the
+        # new positions back onto the vehicles
+        self.speeds[:] = [v.speed for v in self.vehicles]
+        _advance(self.ys, self.prev_ys, self.speeds, self.heights, float(HEIGHT))
+        for v, y, prev_y in zip(self.vehicles, self.ys.tolist(), self.prev_ys.tolist()):
+            v.y = y
+            v.prev_y = prev_y
 
 
 class SensorSystem:
@@ -70,10 +178,30 @@ class SensorSystem:
     Measures distance from the ego vehicle (red car) to a target vehicle (blue car).
     Includes methods for LIDAR and camera with different noise levels.
     """
+    # How many (lidar, camera) noise pairs sample() draws from the RNG at once
+    NOISE_BUFFER_SIZE = 1024
+
     def __init__(self, ego_vehicle, target_vehicle, safe_distance=100):
         self.ego_vehicle = ego_vehicle
         self.target_vehicle = target_vehicle
         self.safe_distance = safe_distance  # "ideal" safe distance in pixels
+
+        # The cone never changes shape relative to the ego car, so draw it
+        # once into a sprite just big enough to hold it: apex at the top
+        # middle, fanning 200 px down and 60 px to either side.
+        # Must be created after pygame.display.set_mode().
+        self._cone_surf = pygame.Surface((121, 201), pygame.SRCALPHA)
+        pygame.draw.polygon(self._cone_surf, (255, 0, 0, 50), [(60, 0), (0, 200), (120, 200)])
+        self._cone_surf = self._cone_surf.convert_alpha()
+
+        self._rng = np.random.default_rng()
+        self._refill_noise()
+
+    def _refill_noise(self):
+        # Draw the next NOISE_BUFFER_SIZE noise pairs in one call; kept as a
+        # list so sample() indexes plain Python floats.
+        self._noise = self._rng.uniform((-2, -5), (2, 5), size=(self.NOISE_BUFFER_SIZE, 2)).tolist()
+        self._noise_i = 0
     
     def get_lidar_reading(self):
         distance = abs(self.target_vehicle.y - self.ego_vehicle.y)
@@ -85,37 +213,83 @@ class SensorSystem:
         noise = random.uniform(-5, 5)
         return max(0, distance + noise)
 
-    def visualize_sensors(self, screen):
+    def sample(self):
+        """
+        Take a LIDAR and a camera reading together: the true distance is
+        computed once and both noise terms come from the pre-drawn buffer.
+        Returns (lidar, camera, true_distance).
+        """
+        distance = abs(self.target_vehicle.y - self.ego_vehicle.y)
+        if self._noise_i == self.NOISE_BUFFER_SIZE:
+            self._refill_noise()
+        lidar_noise, camera_noise = self._noise[self._noise_i]
+        self._noise_i += 1
+        return max(0, distance + lidar_noise), max(0, distance + camera_noise), distance
+
+    def read(self):
+        """
+        This frame's sensor readings as one float32 array:
+        [lidar, camera, average of the two].
+        """
+        lidar, camera, _ = self.sample()
+        return np.array((lidar, camera, (lidar + camera) / 2), dtype=np.float32)
+
+    def visualize_sensors(self, screen, lidar_distance=None):
         """
         - Draw a cone-shaped sensor arc in front of the ego vehicle.
         - Draw a direct line between the vehicles, color-coded by safe/unsafe distance.
+        Pass this frame's LIDAR reading to avoid taking another one.
+        Returns the screen rects it touched.
         """
         ego = self.ego_vehicle
         target = self.target_vehicle
 
         # The direct line from red to blue car
-        distance = self.get_lidar_reading()  # or average
+        distance = lidar_distance if lidar_distance is not None else self.get_lidar_reading()
         if distance >= self.safe_distance:
             color = SAFE_DISTANCE_LINE_COLOR
         else:
             color = UNSAFE_DISTANCE_LINE_COLOR
 
-        pygame.draw.line(screen, color,
-                         (ego.x, ego.y + ego.height / 2),
-                         (target.x, target.y),
-                         2)
+        line_rect = pygame.draw.line(screen, color,
+                                     (int(ego.x), ego.draw_y + ego.height // 2),
+                                     (int(target.x), target.draw_y),
+                                     2)
 
         # Draw a cone (wedge) in front of the red car
-        # We'll just do a wide triangle
         # Starting at the bottom center of the ego car
-        cone_start = (ego.x, ego.y + ego.height)
-        left_spread = (ego.x - 60, ego.y + ego.height + 200)
-        right_spread = (ego.x + 60, ego.y + ego.height + 200)
-        
-        # Make the cone semi-transparent
-        cone_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        pygame.draw.polygon(cone_surface, (255, 0, 0, 50), [cone_start, left_spread, right_spread])
-        screen.blit(cone_surface, (0, 0))
+        cone_rect = screen.blit(self._cone_surf, (int(ego.x) - 60, ego.draw_y + ego.height))
+        return [line_rect, cone_rect]
+
+
+@njit(cache=True, fastmath=True)
+def acc_step(current_speed, max_speed, current_distance, min_safe_distance, desired_speed):
+    """
+    The ACC speed decision on plain floats; returns the new speed.
+    The safe distance grows with current_speed as it was before clamping
+    to max_speed, matching ACCController.calculate_safe_distance.
+    """
+    safe_distance = min_safe_distance + (current_speed / 10)
+
+    # Make sure we never exceed max speed
+    speed = min(current_speed, max_speed)
+
+    # Once settled the controller is almost always in the "comfortable" band,
+    # so test that first and hold speed
+    delta = current_distance - safe_distance
+    if 0 <= delta <= 20:
+        return speed
+
+    if delta < 0:
+        # Decelerate
+        reduction = -delta / safe_distance * 20
+        return max(0.0, speed - reduction)
+
+    # Accelerate
+    return min(desired_speed, speed + 2)
+
+# Compile now (or load from cache) so the first frame doesn't hitch
+acc_step(0.0, 1.0, 100.0, 80.0, 50.0)
 
 
 class ACCController:
@@ -139,25 +313,89 @@ class ACCController:
         - Otherwise, hold
         """
         ego_vehicle = self.sensor_system.ego_vehicle
-        safe_distance = self.calculate_safe_distance(ego_vehicle.speed)
+        new_speed = acc_step(float(ego_vehicle.speed), float(ego_vehicle.max_speed),
+                             float(current_distance), float(self.min_safe_distance),
+                             float(self.desired_speed))
 
         # Make sure we never exceed max speed
         if ego_vehicle.speed > ego_vehicle.max_speed:
             ego_vehicle.speed = ego_vehicle.max_speed
-        
-        if current_distance < safe_distance:
-            # Decelerate
-            reduction = (safe_distance - current_distance) / safe_distance * 20
-            new_speed = max(0, ego_vehicle.speed - reduction)
-            return new_speed
-        elif current_distance > safe_distance + 20:
-            # Accelerate
-            new_speed = min(self.desired_speed, ego_vehicle.speed + 2)
-            return new_speed
-        
-        # If we're within a "comfortable" band, hold speed
-        return ego_vehicle.speed
+        return new_speed
+
+
+def render_cached(font, text, color):
+    """
+    font.render(text, True, color), reusing the surface when the same text
+    was rendered recently.
+    """
+    key = (font, text, color)
+    surf = _TEXT_CACHE.pop(key, None)
+    if surf is None:
+        # Cached labels are blitted many times, so match the display format
+        surf = font.render(text, True, color).convert_alpha()
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_SIZE:
+            # Evict the least recently used entry (dicts keep insertion order)
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+    # (Re)insert at the end, so the front of the dict is always the LRU entry
+    _TEXT_CACHE[key] = surf
+    return surf
+
+
+class DistanceHistory:
+    """
+    Bounded history of recent distances in a fixed NumPy ring buffer that
+    keeps its min and max current, so the plot does not rescan the whole
+    window every frame.
+
+    Every value is written twice, maxlen slots apart, so the window in
+    oldest-to-newest order is always one contiguous slice of the buffer.
+    """
+    def __init__(self, maxlen):
+        self.maxlen = maxlen
+        self._buf = np.empty(2 * maxlen, dtype=np.float32)
+        self._next = 0  # slot the next value goes into
+        self._len = 0
+        self.min_val = None
+        self.max_val = None
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        return self.values()[index]
 
+    def __iter__(self):
+        return iter(self.values())
+
+    def values(self):
+        """
+        The stored distances, oldest first, as a view into the buffer.
+        """
+        end = self._next + self.maxlen
+        return self._buf[end - self._len:end]
+
+    def append(self, value):
+        i = self._next
+        evicted = self._buf[i] if self._len == self.maxlen else None
+        self._buf[i] = self._buf[i + self.maxlen] = value
+        value = self._buf[i]  # as stored, in float32
+        self._next = (i + 1) % self.maxlen
+        self._len = min(self._len + 1, self.maxlen)
+
+        if evicted is not None and (evicted == self.min_val or evicted == self.max_val):
+            # An extreme just left the window; rescan once
+            window = self.values()
+            self.min_val = window.min()
+            self.max_val = window.max()
+        elif self.min_val is None:
+            self.min_val = self.max_val = value
+        else:
+            self.min_val = min(self.min_val, value)
+            self.max_val = max(self.max_val, value)
+
+
+# Center lane dashes: 20 px long with 20 px gaps, as (start, end) points
+_DASHES = tuple(((WIDTH//2, y), (WIDTH//2, y + 20)) for y in range(ROAD_TOP, ROAD_BOTTOM, 40))
 
 def draw_road_and_environment(screen):
     # Fill background with grass
@@ -169,13 +407,8 @@ def draw_road_and_environment(screen):
     
     # Draw lane lines (center dashed line, for example)
     line_color = (255, 255, 255)
-    dash_height = 20
-    gap = 20
-    x_center = WIDTH//2
-    y = ROAD_TOP
-    while y < ROAD_BOTTOM:
-        pygame.draw.line(screen, line_color, (x_center, y), (x_center, y + dash_height), 2)
-        y += dash_height + gap
+    for start, end in _DASHES:
+        pygame.draw.line(screen, line_color, start, end, 2)
 
     # Road boundaries
     pygame.draw.line(screen, (200, 200, 200),
@@ -186,41 +419,54 @@ def draw_road_and_environment(screen):
                      (WIDTH//2 + LANE_WIDTH//2, ROAD_BOTTOM), 4)
 
 
-def draw_distance_plot(screen, distances_deque):
+def draw_distance_plot(screen, distances_deque, font=None):
+    """
+    Draw the recent distance history as a small line plot in the top-right
+    corner. Returns the screen rect it covers.
+    """
+    global _plot_font, _PLOT_PTS
+    if font is None:
+        if _plot_font is None:
+            _plot_font = pygame.font.Font(None, 20)
+        font = _plot_font
+
     plot_width, plot_height = 200, 100
     plot_x, plot_y = WIDTH - plot_width - 10, 10
     margin = 5
 
-    pygame.draw.rect(screen, (240, 240, 240), (plot_x, plot_y, plot_width, plot_height))
+    plot_rect = pygame.draw.rect(screen, (240, 240, 240), (plot_x, plot_y, plot_width, plot_height))
     pygame.draw.rect(screen, (0, 0, 0), (plot_x, plot_y, plot_width, plot_height), 2)
 
     # If we have fewer than 2 points, there's no line to draw
     if len(distances_deque) < 2:
         # Optionally display the single distance if you want
         if len(distances_deque) == 1:
-            font = pygame.font.Font(None, 20)
             text = font.render(f"Distance: {distances_deque[-1]:.1f}", True, (0, 0, 0))
             screen.blit(text, (plot_x + 5, plot_y + 5))
-        return
+        return plot_rect
 
-    max_dist = max(distances_deque)
-    min_dist = min(distances_deque)
+    dists = distances_deque.values().astype(float)
+    max_dist = distances_deque.max_val
+    min_dist = distances_deque.min_val
     dist_range = max_dist - min_dist if max_dist != min_dist else 1
 
-    points = []
-    for i, dist in enumerate(distances_deque):
-        px = plot_x + margin + (i / (len(distances_deque) - 1)) * (plot_width - 2*margin)
-        scaled = (dist - min_dist) / dist_range
-        py = plot_y + (plot_height - margin) - scaled * (plot_height - 2*margin)
-        points.append((px, py))
+    # Scale the whole history into plot coordinates at once, written
+    # straight into the preallocated point buffer
+    n = len(dists)
+    if n > len(_PLOT_PTS):
+        _PLOT_PTS = np.empty((n, 2), dtype=np.int32)
+    points = _PLOT_PTS[:n]
+    scaled = (dists - min_dist) / dist_range
+    points[:, 0] = plot_x + margin + np.arange(n) / (n - 1) * (plot_width - 2*margin)
+    points[:, 1] = plot_y + (plot_height - margin) - scaled * (plot_height - 2*margin)
 
-    if len(points) > 1:
-        pygame.draw.lines(screen, (0, 0, 255), False, points, 2)
+    pygame.draw.lines(screen, (0, 0, 255), False, points, 2)
 
-    # Display the latest distance as text
-    font = pygame.font.Font(None, 20)
+    # Display the latest distance as text. Sensor noise changes it nearly
+    # every tick, so it is rendered directly rather than cached and converted.
     text = font.render(f"Distance: {distances_deque[-1]:.1f}", True, (0, 0, 0))
     screen.blit(text, (plot_x + 5, plot_y + 5))
+    return plot_rect
 
 
 
@@ -238,56 +484,86 @@ def main():
     # Initialize sensor & ACC
     sensor_system = SensorSystem(red_car, blue_car, safe_distance=100)
     acc_controller = ACCController(sensor_system)
+
+    # Both cars move as one fleet (a kernel only kicks in for large fleets)
+    fleet = Fleet([red_car, blue_car])
     
     # Keep track of distance over time for real-time plot
-    distance_history = deque(maxlen=100)  # store last 100 frames
+    distance_history = DistanceHistory(maxlen=100)  # store last 100 ticks
+
+    # The road never changes, so rasterize it once and blit it every frame
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    draw_road_and_environment(background)
+
+    # Fonts are loaded once; opening them is far too slow to do per frame
+    plot_font = pygame.font.Font(None, 20)
+    hud_font = pygame.font.Font(None, 28)
+
+    # The screen starts as the full background; after that only the regions
+    # that change are repainted and pushed to the display.
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+    prev_dirty = []
+
+    accumulator = SIM_DT  # run one tick on the first frame
 
     running = True
     while running:
-        clock.tick(FPS)
+        accumulator += clock.tick(FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
         
-        # Distance measurements
-        lidar_distance = sensor_system.get_lidar_reading()
-        camera_distance = sensor_system.get_camera_reading()
-        avg_distance = (lidar_distance + camera_distance) / 2
+        # Advance the simulation in fixed ticks for the time that has passed
+        accumulator = min(accumulator, MAX_TICKS_PER_FRAME * SIM_DT)
+        while accumulator >= SIM_DT:
+            accumulator -= SIM_DT
+
+            # Distance measurements
+            lidar_distance, camera_distance, avg_distance = sensor_system.read()
+            
+            # Update red car's speed via ACC
+            red_car.speed = acc_controller.control_speed(avg_distance)
+            
+            # Keep the blue car at constant speed
+            blue_car.speed = 3
+            
+            # Update positions
+            fleet.update()
+
+            # Update distance history for plotting
+            distance_history.append(avg_distance)
+
+        # Draw the cars part-way between their last two ticks
+        alpha = accumulator / SIM_DT
+        red_car.interpolate(alpha)
+        blue_car.interpolate(alpha)
         
-        # Update red car's speed via ACC
-        red_car.speed = acc_controller.control_speed(avg_distance)
-        
-        # Keep the blue car at constant speed
-        blue_car.speed = 3
-        
-        # Update positions
-        red_car.update()
-        blue_car.update()
-        
-        # Draw environment
-        draw_road_and_environment(screen)
+        # Draw environment: erase last frame's cars, sensors and HUD by
+        # restoring the background underneath them
+        for rect in prev_dirty:
+            screen.blit(background, rect, rect)
+        dirty = []
         
         # Draw vehicles
-        blue_car.draw(screen)
-        red_car.draw(screen)
+        dirty.append(blue_car.draw(screen))
+        dirty.append(red_car.draw(screen))
         
         # Visualize sensors (cone + distance line)
-        sensor_system.visualize_sensors(screen)
+        dirty.extend(sensor_system.visualize_sensors(screen, lidar_distance))
 
-        # Update distance history for plotting
-        distance_history.append(avg_distance)
-        
         # Draw a small real-time plot in top-right
-        draw_distance_plot(screen, distance_history)
+        dirty.append(draw_distance_plot(screen, distance_history, font=plot_font))
         
         # Speed displays
-        font = pygame.font.Font(None, 28)
-        blue_speed_text = font.render(f'Blue Car Speed: {blue_car.speed:.1f}', True, (0, 0, 0))
-        red_speed_text = font.render(f'Red Car Speed : {red_car.speed:.1f}', True, (0, 0, 0))
-        screen.blit(blue_speed_text, (10, 10))
-        screen.blit(red_speed_text, (10, 40))
+        blue_speed_text = render_cached(hud_font, f'Blue Car Speed: {blue_car.speed:.1f}', (0, 0, 0))
+        red_speed_text = render_cached(hud_font, f'Red Car Speed : {red_car.speed:.1f}', (0, 0, 0))
+        dirty.append(screen.blit(blue_speed_text, (10, 10)))
+        dirty.append(screen.blit(red_speed_text, (10, 40)))
         
-        pygame.display.flip()
+        # Present the erased regions along with the newly drawn ones
+        pygame.display.update(prev_dirty + dirty)
+        prev_dirty = dirty
     
     pygame.quit()
 